@@ -6,35 +6,106 @@ hear them trash-talk each other, and see HP drop during the commentary round.
 """
 
 import asyncio
-import base64
+import atexit
+import hashlib
 import http.server
 import json
+import mimetypes
 import os
+import queue
 import random
+import shutil
 import subprocess
 import sys
 import threading
 import time
-from dataclasses import dataclass
+import urllib.parse
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from functools import partial
 from pathlib import Path
-from queue import Queue, Empty
 from typing import Optional, List
 
 from cartesia import AsyncCartesia
+import orjson
 import pyaudio
 
 
+# claude is looked up on PATH once, at import, for every agent and LLM call
+CLAUDE_ARGV = (shutil.which("claude") or "claude", "--output-format", "stream-json", "--verbose",
+               "--dangerously-skip-permissions", "-p")
+CLAUDE_JSON_ARGV = (CLAUDE_ARGV[0], "--output-format", "json", "-p")
+
 # Wrestling announcer voice (deep/dramatic)
 ANNOUNCER_VOICE_ID = "ee5b6a37-8fb4-d49f-a1c1-8b3f71c0edcf"  # Deep announcer
+# Battle speech streams at 16kHz: a third fewer bytes per second of audio and
+# still clear for trash talk. The local --demo keeps full quality.
+BATTLE_SAMPLE_RATE = 16000
+HIGH_QUALITY_SAMPLE_RATE = 24000
+
+# All terminal output goes through one printer thread, so callers never wait
+# on each other and lines are never interleaved mid-write.
+_PRINT_QUEUE = queue.SimpleQueue()
+PRINT_BATCH = 64  # most messages joined into one write
+
+
+def _printer():
+    while True:
+        item = _PRINT_QUEUE.get()
+        parts, waiters = [], []
+        while True:
+            if isinstance(item, str):
+                parts.append(item)
+            else:
+                waiters.append(item)  # flush_prints() marker
+            if len(parts) >= PRINT_BATCH:
+                break
+            try:
+                item = _PRINT_QUEUE.get_nowait()
+            except queue.Empty:
+                break
+        if parts:
+            sys.stdout.write("".join(parts))
+            sys.stdout.flush()
+        for waiter in waiters:
+            waiter.set()
+
 
-PRINT_LOCK = threading.Lock()
+threading.Thread(target=_printer, daemon=True, name="printer").start()
 
 
 def safe_print(msg: str, end: str = "\n"):
-    with PRINT_LOCK:
-        sys.stdout.write(msg + end)
-        sys.stdout.flush()
+    _PRINT_QUEUE.put(msg + end)
+
+
+def flush_prints(timeout: float = 2.0):
+    """Block until everything printed so far has reached stdout."""
+    done = threading.Event()
+    _PRINT_QUEUE.put(done)
+    done.wait(timeout)
+
+
+atexit.register(flush_prints)
+
+
+def open_pcm_stream(rate: int, frames_per_buffer: int):
+    """Open a mono s16le output stream. Returns (PyAudio, stream)."""
+    audio = pyaudio.PyAudio()
+    try:
+        stream = audio.open(format=pyaudio.paInt16, channels=1, rate=rate,
+                            output=True, frames_per_buffer=frames_per_buffer)
+    except Exception:
+        audio.terminate()  # don't leak the PortAudio session on a bad device
+        raise
+    return audio, stream
+
+
+def shuffled_cycle(items, rng: random.Random):
+    """Yield items forever in shuffled passes, so none repeats until all have played."""
+    items = list(items)
+    while items:
+        rng.shuffle(items)
+        yield from items
 
 
 @dataclass
@@ -43,7 +114,6 @@ class Competitor:
     emoji: str
     approach: str
     voice_id: str
-    port: int
     color: str
     tagline: str
     intro: List[str]
@@ -52,6 +122,17 @@ class Competitor:
     self_hype: List[str]
     frustrated: List[str]
     victory: List[str]
+    # Derived phrase pools, built once instead of on every streamed event
+    think_hype: tuple = field(init=False, repr=False)
+    trash_parts: tuple = field(init=False, repr=False)
+    # Each fighter draws from its own generator rather than the shared module one
+    rng: random.Random = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.rng = random.Random()
+        self.think_hype = tuple(self.thinking + self.self_hype)
+        # Templates pre-split on the placeholder, so rendering is a join
+        self.trash_parts = tuple(tuple(t.split("{opponent}")) for t in self.trash_talk)
 
 
 ALL_COMPETITORS = [
@@ -60,7 +141,6 @@ ALL_COMPETITORS = [
         emoji="💅",
         approach="make it super cute and aesthetic with pink colors, sparkles, and girly vibes - like, literally the cutest website ever",
         voice_id="b7d50908-b17c-442d-ad8d-810c63997ed9",
-        port=8001,
         color="\033[95m",
         tagline="Aesthetic queen, like literally",
         intro=["Oh my GOD you guys, I am SO ready to make the cutest website EVER!",
@@ -83,7 +163,6 @@ ALL_COMPETITORS = [
         emoji="⚡",
         approach="make it epic and dramatic like an anime opening - flashy effects, bold colors, maximum hype like a shonen protagonist",
         voice_id="498e7f37-7fa3-4e2c-b8e2-8b6e9276f956",
-        port=8002,
         color="\033[93m",
         tagline="Ultimate protagonist energy",
         intro=["YES! The time has come to unleash my ultimate coding technique! This will be LEGENDARY!",
@@ -106,7 +185,6 @@ ALL_COMPETITORS = [
         emoji="🏄",
         approach="keep it chill and laid-back with ocean vibes, good colors, nothing too complicated - just mellow good-vibes-only mate",
         voice_id="41f3c367-e0a8-4a85-89e0-c27bae9c9b6d",
-        port=8003,
         color="\033[96m",
         tagline="Chill vibes only, no stress",
         intro=["Yeah nah, let's just cruise through this one, no stress, good vibes only mate!",
@@ -129,7 +207,6 @@ ALL_COMPETITORS = [
         emoji="🎮",
         approach="dark mode, neon accents, gaming aesthetic - edgy, high contrast, with gaming references and energy",
         voice_id="e3827ec5-697a-4b7c-9704-1a23041bbc51",  # Gamer voice
-        port=8001,
         color="\033[92m",
         tagline="Skill issue if you can't read this",
         intro=["GG let's GO! This is gonna be no diff for me!",
@@ -152,7 +229,6 @@ ALL_COMPETITORS = [
         emoji="💼",
         approach="clean enterprise SaaS aesthetic - professional, blue/white palette, lots of CTAs, synergized value propositions",
         voice_id="c45bc1d0-0571-4be7-a642-23b943e99611",  # Professional voice
-        port=8002,
         color="\033[94m",
         tagline="Leveraging synergies since Q1",
         intro=["Per my last commit, I'm excited to leverage this opportunity to deliver stakeholder value.",
@@ -175,7 +251,6 @@ ALL_COMPETITORS = [
         emoji="🧶",
         approach="warm, cozy, readable website - large text, cream and brown warm colors, like a comfy knitting blog with heart",
         voice_id="f785af04-229c-4a7c-b71b-f3194c7f08bb",  # Warm grandma voice
-        port=8003,
         color="\033[97m",
         tagline="Made with love and cookie recipes",
         intro=["Oh how lovely, let me put on my reading glasses and get started dear!",
@@ -196,15 +271,30 @@ ALL_COMPETITORS = [
 ]
 
 
+class _Row:
+    """One competitor's line in the progress display, updated in place."""
+
+    __slots__ = ("head", "status", "events")
+
+    def __init__(self, c: Competitor):
+        self.head = f"\033[2K{c.color}  {c.name:15s} ["
+        self.status = "waiting"
+        self.events = 0
+
+
 class ProgressDisplay:
     """Thread-safe in-place ASCII progress bar renderer."""
 
     BAR_WIDTH = 25
+    DEBOUNCE = 0.05  # lets a burst of updates land in one redraw
+    RULE = "\033[2K" + "─" * 60 + "\n"
 
     def __init__(self, competitors: List[Competitor]):
         self._competitors = competitors
-        self._data = {c.name: {"status": "waiting", "events": 0} for c in competitors}
+        self._rows = {c.name: _Row(c) for c in competitors}
         self._lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._last_sig = None  # what the bars on screen currently show
         self._running = False
         self._thread = None
         self._lines_reserved = len(competitors) + 2  # header + bars + separator
@@ -221,33 +311,38 @@ class ProgressDisplay:
 
     def update(self, name: str, status: str, events: int):
         with self._lock:
-            self._data[name] = {"status": status, "events": events}
+            row = self._rows[name]
+            row.status = status
+            row.events = events
+        self._dirty.set()
 
     def _render_loop(self):
+        # Redraw when something changed instead of on a fixed timer; stop()
+        # sets the event too, so no timeout is needed to notice shutdown
         while self._running:
+            self._dirty.wait()
+            self._dirty.clear()
+            time.sleep(self.DEBOUNCE)
             self._redraw()
-            time.sleep(0.3)
 
     def _redraw(self):
-        with PRINT_LOCK:
-            # Move cursor up to the progress bars
-            lines_up = self._lines_reserved
-            sys.stdout.write(f"\033[{lines_up}A")
-            sys.stdout.write("\033[2K" + "─" * 60 + "\n")
-            sys.stdout.write("\033[2K📊 LIVE PROGRESS\n")
-            with self._lock:
-                for c in self._competitors:
-                    d = self._data[c.name]
-                    filled = min(self.BAR_WIDTH, d["events"] // 3)
-                    bar = "█" * filled + "░" * (self.BAR_WIDTH - filled)
-                    status = d["status"][:20]
-                    line = f"  {c.name:15s} [{bar}] {d['events']:3d} events - {status}"
-                    sys.stdout.write(f"\033[2K{c.color}{line}\033[0m\n")
-            sys.stdout.write("\033[2K" + "─" * 60 + "\n")
-            sys.stdout.flush()
+        with self._lock:
+            sig = tuple((row.status, row.events) for row in self._rows.values())
+        if sig == self._last_sig:
+            return  # e.g. an update that didn't change anything
+        self._last_sig = sig
+        # Build the whole frame first so it goes out as one write
+        parts = [f"\033[{self._lines_reserved}A", self.RULE, "\033[2K📊 LIVE PROGRESS\n"]
+        for row, (status, events) in zip(self._rows.values(), sig):
+            filled = min(self.BAR_WIDTH, events // 3)
+            bar = "█" * filled + "░" * (self.BAR_WIDTH - filled)
+            parts.append(f"{row.head}{bar}] {events:3d} events - {status[:20]}\033[0m\n")
+        parts.append(self.RULE)
+        safe_print("".join(parts), end="")
 
     def stop(self):
         self._running = False
+        self._dirty.set()
         if self._thread:
             self._thread.join(timeout=1)
 
@@ -266,7 +361,9 @@ body {{ background: #0a0a1a; color: #fff; font-family: 'Courier New', monospace;
 .hp-section {{ padding: 6px 10px; background: rgba(0,0,0,0.9); border-bottom: 1px solid #333; }}
 .fighter-name {{ font-size: 13px; font-weight: bold; margin-bottom: 4px; display: flex; justify-content: space-between; }}
 .hp-track {{ width: 100%; height: 14px; background: #1a1a1a; border-radius: 7px; overflow: hidden; border: 1px solid #333; }}
-.hp-fill {{ height: 100%; border-radius: 7px; transition: width 0.4s ease, background-color 0.4s ease; }}
+.hp-fill {{ height: 100%; border-radius: 7px; background-color: var(--hp-color); transition: width 0.4s ease, background-color 0.4s ease; }}
+.panel[data-hp-band="mid"] .hp-fill {{ background-color: #ffa500; }}
+.panel[data-hp-band="low"] .hp-fill {{ background-color: #ff2200; }}
 iframe {{ flex: 1; border: none; background: #fff; }}
 .overlay {{ display: none; position: absolute; inset: 0; align-items: center; justify-content: center; flex-direction: column; z-index: 100; }}
 .overlay.winner {{ display: flex; background: radial-gradient(ellipse, rgba(255,215,0,0.3) 0%, rgba(0,0,0,0.7) 100%); animation: pulse 1s infinite alternate; }}
@@ -290,17 +387,17 @@ const prevHp = {{}};
 competitors.forEach((c, i) => {{
     prevHp[c.name] = 100;
     arena.innerHTML += `
-    <div class="panel" id="panel-${{c.name}}">
+    <div class="panel" id="panel-${{c.name}}" data-hp-band="high" style="--hp-color: ${{c.color}}">
       <div class="hp-section" style="border-top: 3px solid ${{c.color}}">
         <div class="fighter-name" style="color: ${{c.color}}">
           <span>${{c.emoji}} ${{c.name}}</span>
           <span id="hp-text-${{c.name}}">❤️ 100</span>
         </div>
         <div class="hp-track">
-          <div class="hp-fill" id="hp-bar-${{c.name}}" style="width:100%; background: ${{c.color}}"></div>
+          <div class="hp-fill" id="hp-bar-${{c.name}}" style="width:100%"></div>
         </div>
       </div>
-      <iframe src="http://localhost:${{c.port}}" id="frame-${{c.name}}"></iframe>
+      <iframe src="/sites/${{c.slug}}/" id="frame-${{c.name}}"></iframe>
       <div class="overlay" id="overlay-${{c.name}}">
         <div class="overlay-text" id="overlay-text-${{c.name}}"></div>
         <div class="overlay-sub" id="overlay-sub-${{c.name}}"></div>
@@ -308,48 +405,46 @@ competitors.forEach((c, i) => {{
     </div>`;
 }});
 
-async function poll() {{
-    try {{
-        const r = await fetch('/state');
-        const state = await r.json();
+function render(state) {{
+    state.competitors.forEach(c => {{
+        const hp = Math.max(0, c.hp);
+        const bar = document.getElementById('hp-bar-' + c.name);
+        const txt = document.getElementById('hp-text-' + c.name);
+        const panel = document.getElementById('panel-' + c.name);
+        if (bar) {{
+            if (hp < prevHp[c.name]) {{
+                panel.classList.add('damage-flash');
+                setTimeout(() => panel.classList.remove('damage-flash'), 300);
+            }}
+            prevHp[c.name] = hp;
+            bar.style.width = hp + '%';
+            panel.dataset.hpBand = hp > 60 ? 'high' : hp > 30 ? 'mid' : 'low';
+            txt.textContent = '❤️ ' + hp;
+        }}
+    }});
+    if (state.winner) {{
         state.competitors.forEach(c => {{
-            const hp = Math.max(0, c.hp);
-            const bar = document.getElementById('hp-bar-' + c.name);
-            const txt = document.getElementById('hp-text-' + c.name);
-            const panel = document.getElementById('panel-' + c.name);
-            if (bar) {{
-                if (hp < prevHp[c.name]) {{
-                    panel.classList.add('damage-flash');
-                    setTimeout(() => panel.classList.remove('damage-flash'), 300);
-                }}
-                prevHp[c.name] = hp;
-                bar.style.width = hp + '%';
-                bar.style.backgroundColor = hp > 60 ? c.color : hp > 30 ? '#ffa500' : '#ff2200';
-                txt.textContent = '❤️ ' + hp;
+            const overlay = document.getElementById('overlay-' + c.name);
+            const txt = document.getElementById('overlay-text-' + c.name);
+            const sub = document.getElementById('overlay-sub-' + c.name);
+            if (c.name === state.winner) {{
+                overlay.classList.add('winner');
+                txt.textContent = '🏆 WINNER!';
+                txt.style.color = 'gold';
+                sub.textContent = c.name.toUpperCase();
+            }} else {{
+                overlay.classList.add('loser');
+                txt.textContent = '💀';
+                txt.style.color = '#666';
+                sub.textContent = 'ELIMINATED';
             }}
         }});
-        if (state.winner) {{
-            state.competitors.forEach(c => {{
-                const overlay = document.getElementById('overlay-' + c.name);
-                const txt = document.getElementById('overlay-text-' + c.name);
-                const sub = document.getElementById('overlay-sub-' + c.name);
-                if (c.name === state.winner) {{
-                    overlay.classList.add('winner');
-                    txt.textContent = '🏆 WINNER!';
-                    txt.style.color = 'gold';
-                    sub.textContent = c.name.toUpperCase();
-                }} else {{
-                    overlay.classList.add('loser');
-                    txt.textContent = '💀';
-                    txt.style.color = '#666';
-                    sub.textContent = 'ELIMINATED';
-                }}
-            }});
-        }}
-    }} catch(e) {{}}
-    setTimeout(poll, 500);
+    }}
 }}
-poll();
+// The server pushes state whenever HP or the winner changes; EventSource
+// reconnects on its own if the stream drops
+const events = new EventSource('/events');
+events.onmessage = (e) => render(JSON.parse(e.data));
 </script>
 </body>
 </html>"""
@@ -358,80 +453,402 @@ poll();
 class BattleArena:
     """Manages the battle royale between agents."""
 
-    SAMPLE_RATE = 24000
+    SAMPLE_RATE = BATTLE_SAMPLE_RATE
+    SPEECH_TIMEOUT = 20  # max seconds to wait for one utterance to finish playing
+    STREAM_LIMIT = 16 * 1024 * 1024  # stream-json lines carry whole file writes
+    CACHE_CHUNK = 4096  # bytes per slice when replaying cached PCM
+    PCM_MEMO_SIZE = 128  # utterances kept in memory (a few MB at 16kHz)
+    AUDIO_PERIOD_FRAMES = 4096  # PyAudio buffer size, and the write coalescing target
+    PREBUFFER_SECONDS = 0.2  # audio to collect before playback starts from silence
+    SPEECH_QUEUE_SIZE = 8
+    CHATTER_TICK = 1.0  # minimum read wait; a failed chatter roll retries at most once a tick
+    PROGRESS_INTERVAL = 0.1  # at most this often per competitor while events stream
+    TRASH_INTERVAL = 10  # minimum seconds between one fighter's trash talk
+    HYPE_INTERVAL = 15
+    TTS_ATTEMPTS = 3
+    RECONNECT_BASE = 0.25  # first reconnect delay; doubles per consecutive failure
+    RECONNECT_MAX = 8.0
+    PREWARM_CONCURRENCY = 2  # background cache fills in flight at once
+    LLM_TIMEOUT = 30
+    LLM_CONCURRENCY = 4  # claude CLI processes allowed to run at once
+    SITE_FILE_MAX = 2 * 1024 * 1024  # bigger site files are served from disk
+    SITE_CACHE_MAX = 32 * 1024 * 1024  # total site bytes kept in memory
+    PROMPT_HTML_CHARS = 2000  # page excerpt each critique/defense prompt sees
+    HTML_HEAD_BYTES = 8192  # enough for that excerpt even with multibyte text
+    SPEECH_BACKLOG = 3  # optional chatter is dropped once this many lines are waiting
 
     def __init__(self, task: str, competitors: List[Competitor]):
         self.task = task
         self.competitors = competitors
         self.arena_dir = Path("/tmp/battle_arena")
         self.arena_dir.mkdir(exist_ok=True)
+        self._tts_cache_dir = self.arena_dir / "tts_cache"
+        self._tts_cache_dir.mkdir(exist_ok=True)
+        # (voice_id, text) -> PCM for anything already said this run, fixed
+        # or not; LRU so repeated fallbacks and critiques replay instantly
+        self._pcm_memo = OrderedDict()
 
         # HP tracking
         self.hp = {c.name: 100 for c in competitors}
         self.hp_lock = threading.Lock()
         self.winner = None
+        # Bumped (under hp_lock) on every HP/winner change; /events streams wait on it
+        self.state_version = 0
+        self.state_changed = threading.Condition(self.hp_lock)
 
         # Shared progress state
         self.progress = {c.name: {"status": "starting", "events": 0} for c in competitors}
         self.progress_lock = threading.Lock()
 
+        # Trash talk fully rendered for every opponent in this roster, so a
+        # trigger is a single choice with no opponent lookup or formatting
+        self._trash = {c.name: tuple(o.name.join(parts) for o in competitors if o is not c
+                                     for parts in c.trash_parts)
+                       for c in competitors}
+
         # Audio setup
-        self._audio = pyaudio.PyAudio()
-        self._stream = self._audio.open(
-            format=pyaudio.paInt16, channels=1, rate=self.SAMPLE_RATE,
-            output=True, frames_per_buffer=1024
-        )
-        self._audio_queue = Queue()
+        # The output device is opened by the audio thread on its first write,
+        # so nothing holds it until there is actually something to play
+        self._audio = None
+        self._stream = None
+        self._audio_failed = False  # device unusable: keep pacing, drop the audio
+        # PCM chunks go straight from the websocket into a deque; append/popleft
+        # are atomic, so the only synchronisation is a wakeup event when idle.
+        self._audio_queue = deque()
+        self._audio_ready = threading.Event()
         self._audio_thread = threading.Thread(target=self._audio_loop, daemon=True)
-        self._running = True
         self._audio_thread.start()
 
-        self._client = None
-        self._speech_queue = Queue()
-        self._speech_thread = threading.Thread(target=self._speech_loop, daemon=True)
-        self._speech_thread.start()
+        # One long-running event loop owns all async work. Threads hand it
+        # coroutines via run_coroutine_threadsafe instead of spinning up
+        # their own loops.
+        self._loop = asyncio.new_event_loop()
+        # Most tasks here (gather fan-outs, cache hits) finish or block almost
+        # immediately; eager tasks (Python 3.12+) skip a scheduler round trip
+        eager = getattr(asyncio, "eager_task_factory", None)
+        if eager is not None:
+            self._loop.set_task_factory(eager)
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
+
+        # One client and one websocket for the whole battle, so each utterance
+        # skips the TLS/HTTP handshake. The socket is opened lazily on the
+        # shared loop, which is the only place it is used.
+        self._client = AsyncCartesia(api_key=os.environ.get("CARTESIA_API_KEY"))
+        self._ws = None
+        self._ws_failures = 0  # consecutive failures, drives reconnect backoff
+        self._llm_slots = None  # Semaphore, created on the loop on first use
+        # The speech worker is a task on the shared loop too. The queue is
+        # built there so it binds to that loop (Python 3.9 binds at creation).
+        self._speech_queue = self._run_on_loop(self._new_speech_queue())
+        self._speech_worker = asyncio.run_coroutine_threadsafe(self._speech_loop(), self._loop)
 
         self._progress_display = ProgressDisplay(competitors)
 
+        # Background fill of the phrase cache; started by _run_competitors once
+        # the intros have played, so it never competes with the first live lines
+        self._prewarm = None
+        self._spoken_cached = set()  # (voice_id, text) of cached lines queued live
+        self._played_waiters = {}  # done event -> loop future, touched on the loop only
+
     def _audio_loop(self):
-        while self._running:
-            try:
-                chunk = self._audio_queue.get(timeout=0.1)
-                self._stream.write(chunk)
-            except Empty:
+        period = self.AUDIO_PERIOD_FRAMES * 2  # s16le mono
+        prebuffer = int(self.SAMPLE_RATE * self.PREBUFFER_SECONDS) * 2
+        buf = bytearray()
+        primed = False  # playing; cleared whenever the queue runs dry
+        while True:
+            # Coalesce whatever is queued into one write, stopping at a control item
+            want = period if primed else max(period, prebuffer)
+            control = False
+            while self._audio_queue and len(buf) < want:
+                item = self._audio_queue.popleft()
+                if isinstance(item, bytes):
+                    buf += item
+                else:
+                    control = True
+                    break
+
+            if not primed and not control and len(buf) < prebuffer:
+                # Starting from silence: hold off until enough audio is queued
+                # that playback doesn't start and immediately underrun
+                self._audio_ready.clear()
+                if not self._audio_queue:
+                    if not self._audio_ready.wait(self.PREBUFFER_SECONDS if buf else None):
+                        primed = True  # slow stream; play whatever has arrived
                 continue
 
-    def _speech_loop(self):
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        while self._running:
-            try:
-                text, voice_id, name, color = self._speech_queue.get(timeout=0.5)
-                safe_print(f"{color}[{name}] 🎙️  {text}\033[0m")
-                loop.run_until_complete(self._speak(text, voice_id))
-                time.sleep(0.2)
-            except Empty:
+            # Chunk boundaries needn't fall on a sample; write whole frames only
+            # and carry a split byte into the next write so the stream stays aligned
+            whole = len(buf) & ~1
+            if whole:
+                self._write_pcm(bytes(buf[:whole]))
+                del buf[:whole]
+                primed = True
+            if control:
+                buf.clear()  # a half sample can't span utterances
+                if item is None:  # shutdown sentinel
+                    break
+                item()  # end-of-utterance marker: everything before it is written
                 continue
 
-    async def _speak(self, text: str, voice_id: str):
-        if not self._client:
-            self._client = AsyncCartesia(api_key=os.environ.get("CARTESIA_API_KEY"))
+            if not self._audio_queue:
+                self._audio_ready.clear()
+                # Re-check after clearing so a chunk pushed in between isn't missed
+                if not self._audio_queue:
+                    primed = False
+                    self._audio_ready.wait()
+
+    def _write_pcm(self, pcm: bytes):
+        # A device error must not kill this thread: the end-of-utterance
+        # markers it calls are what pace the speech worker and commentary
+        if self._audio_failed:
+            time.sleep(len(pcm) / (2 * self.SAMPLE_RATE))  # silent, but at speaking pace
+            return
         try:
-            async for output in self._client.tts.sse(
-                model_id="sonic-2", transcript=text,
-                voice={"mode": "id", "id": voice_id},
-                output_format={"container": "raw", "encoding": "pcm_s16le", "sample_rate": self.SAMPLE_RATE}
-            ):
-                if hasattr(output, "data") and output.data:
-                    self._audio_queue.put(base64.b64decode(output.data))
-        except Exception as e:
-            safe_print(f"  [tts error] {e}")
+            if self._stream is None:
+                self._audio, self._stream = open_pcm_stream(self.SAMPLE_RATE, self.AUDIO_PERIOD_FRAMES)
+            self._stream.write(pcm)
+        except Exception as e:  # PortAudio errors aren't all OSError
+            self._audio_failed = True
+            safe_print(f"  [audio error] {e} - continuing without sound")
+
+    def _push_audio(self, chunk: bytes):
+        self._audio_queue.append(chunk)
+        self._audio_ready.set()
+
+    def _submit(self, coro):
+        """Schedule a coroutine on the shared event loop; returns a concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _run_on_loop(self, coro):
+        """Run a coroutine on the shared event loop and wait for its result."""
+        return self._submit(coro).result()
+
+    async def _new_speech_queue(self) -> asyncio.Queue:
+        return asyncio.Queue(maxsize=self.SPEECH_QUEUE_SIZE)
+
+    async def _speech_loop(self):
+        # Synthesis of the next line overlaps playback of the current one; its
+        # chunks queue up behind the current line's in the audio deque.
+        gap = bytes(int(self.SAMPLE_RATE * 0.2) * 2)  # 200ms of s16le silence
+        pending = deque()  # playback futures of lines handed to the audio thread
+        while True:
+            item = await self._speech_queue.get()
+            if item is None:  # shutdown sentinel
+                break
+            text, voice_id, name, color, done, cache = item
+            # Prefetch depth 1: with one line playing, synthesize the next
+            # and wait for the older one before going further ahead.
+            while len(pending) > 1:
+                try:
+                    await asyncio.wait_for(pending.popleft(), self.SPEECH_TIMEOUT)
+                except asyncio.TimeoutError:
+                    pass
+            safe_print(f"{color}[{name}] 🎙️  {text}\033[0m")
+            await self._say(text, voice_id, cache)
+            played = self._loop.create_future()
+            self._push_audio(gap)
+            self._push_audio(partial(self._mark_played, done, played))
+            pending.append(played)
+        await self._close_tts()
+
+    def _mark_played(self, done: threading.Event, played: asyncio.Future):
+        """Called by the audio thread once every chunk of an utterance is written."""
+        done.set()
+        self._loop.call_soon_threadsafe(self._resolve_played, done, played)
+
+    def _resolve_played(self, done: threading.Event, played: asyncio.Future):
+        for fut in (played, self._played_waiters.pop(done, None)):
+            if fut is not None and not fut.done():
+                fut.set_result(None)
+
+    async def _wait_played(self, done: threading.Event):
+        """Await, on the loop, a line queued by queue_speech finishing playback."""
+        if done.is_set():
+            return
+        # _mark_played sets done before scheduling _resolve_played, so a
+        # line finishing after the check above still resolves this future
+        fut = self._played_waiters[done] = self._loop.create_future()
+        try:
+            await fut
+        finally:
+            self._played_waiters.pop(done, None)
+
+    def _cache_path(self, text: str, voice_id: str) -> Path:
+        key = hashlib.blake2b(f"{voice_id}:{self.SAMPLE_RATE}:{text}".encode(), digest_size=16).hexdigest()
+        return self._tts_cache_dir / f"{key}.pcm"
+
+    def _store_cached(self, path: Path, pcm: bytes):
+        # Write then rename so a concurrent reader never sees a partial file.
+        # The temp name is per thread: prewarm and the speech worker may race.
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp.write_bytes(pcm)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def _cacheable_lines(self):
+        """Every fixed line this roster can say, trash talk rendered per opponent."""
+        for c in self.competitors:
+            for text in (*c.intro, *c.think_hype, *c.frustrated, *c.victory, *self._trash[c.name]):
+                yield text, c.voice_id
+
+    async def _prewarm_cache(self, after: threading.Event):
+        await self._wait_played(after)  # until the queued intros have played
+        missing = {self._cache_path(t, v): (t, v) for t, v in self._cacheable_lines()}
+        missing = {p: tv for p, tv in missing.items() if not p.exists()}
+        if not missing:
+            return
+        limit = asyncio.Semaphore(self.PREWARM_CONCURRENCY)
+        failed = 0
+
+        async def fill(path, text, voice_id):
+            nonlocal failed
+            async with limit:
+                # Spoken (or queued to be) in the meantime: the live line stores it
+                if path.exists() or (voice_id, text) in self._spoken_cached:
+                    return
+                pcm = bytearray()
+                try:
+                    async for chunk in self._client.tts.bytes(
+                        model_id="sonic-2", transcript=text,
+                        voice={"mode": "id", "id": voice_id},
+                        output_format={"container": "raw", "encoding": "pcm_s16le", "sample_rate": self.SAMPLE_RATE},
+                    ):
+                        pcm.extend(chunk)
+                except Exception:
+                    failed += 1
+                    return  # left for _say to fill on first use
+                if pcm:
+                    self._store_cached(path, pcm)
+
+        await asyncio.gather(*(fill(p, t, v) for p, (t, v) in missing.items()))
+        if failed:
+            safe_print(f"  [tts cache] {failed} of {len(missing)} lines couldn't be prerendered; "
+                       f"they'll be synthesized when first spoken")
+
+    async def _say(self, text: str, voice_id: str, cache: bool):
+        """Play one line from memory, then the disk cache (fixed lines), then Cartesia."""
+        key = (voice_id, text)
+        pcm = self._pcm_memo.get(key)
+        if pcm is not None:
+            self._pcm_memo.move_to_end(key)
+            self._push_pcm(pcm)
+            return
+
+        path = self._cache_path(text, voice_id) if cache else None
+        if path is not None:
+            try:
+                pcm = path.read_bytes()
+            except OSError:
+                pcm = None
+            if pcm:
+                self._push_pcm(pcm)
+                self._remember(key, pcm)
+                return
+
+        # Still streamed as it arrives; the copy is only kept once it's complete
+        buf = bytearray()
+        if await self._speak(text, voice_id, buf) and buf:
+            pcm = bytes(buf)
+            self._remember(key, pcm)
+            if path is not None:
+                self._store_cached(path, pcm)
+
+    def _push_pcm(self, pcm: bytes):
+        for i in range(0, len(pcm), self.CACHE_CHUNK):
+            self._push_audio(pcm[i:i + self.CACHE_CHUNK])
+
+    def _remember(self, key, pcm: bytes):
+        self._pcm_memo[key] = pcm
+        if len(self._pcm_memo) > self.PCM_MEMO_SIZE:
+            self._pcm_memo.popitem(last=False)
+
+    async def _speak(self, text: str, voice_id: str, sink: Optional[bytearray] = None) -> bool:
+        """Stream one utterance to the speaker, teeing the PCM into sink if given."""
+        for _ in range(self.TTS_ATTEMPTS):
+            started = False
+            try:
+                ws = await self._connect_ws()
+                async for output in await ws.send(
+                    model_id="sonic-2", transcript=text,
+                    voice={"mode": "id", "id": voice_id},
+                    output_format={"container": "raw", "encoding": "pcm_s16le", "sample_rate": self.SAMPLE_RATE},
+                    stream=True,
+                ):
+                    if hasattr(output, "audio") and output.audio:
+                        started = True
+                        self._push_audio(output.audio)
+                        if sink is not None:
+                            sink.extend(output.audio)
+                self._ws_failures = 0
+                return True
+            except Exception as e:
+                safe_print(f"  [tts error] {e}")
+                # Drop the socket so the next attempt reconnects cleanly
+                await self._close_ws()
+                self._ws_failures += 1
+                if started:  # part of the line already played; don't repeat it
+                    return False
+        return False
+
+    async def _connect_ws(self):
+        if self._ws is None:
+            if self._ws_failures:
+                delay = self.RECONNECT_BASE * 2 ** (self._ws_failures - 1)
+                await asyncio.sleep(min(delay, self.RECONNECT_MAX))
+            self._ws = await self._client.tts.websocket()
+        return self._ws
+
+    async def _close_ws(self):
+        ws, self._ws = self._ws, None
+        if ws:
+            try:
+                await ws.close()
+            except Exception:
+                pass
 
-    def queue_speech(self, text: str, competitor: Competitor):
-        self._speech_queue.put((text, competitor.voice_id, competitor.name, competitor.color))
+    async def _close_tts(self):
+        await self._close_ws()
+        await self._client.close()
+
+    def queue_speech(self, text: str, competitor: Competitor, cache: bool = False,
+                     optional: bool = False) -> threading.Event:
+        """Queue a line; the returned event is set once it has finished playing.
+
+        Pass cache=True for fixed phrases so their audio is reused across runs.
+        Optional lines (chatter, trash talk) are dropped instead of queued when
+        the speakers are backlogged, and never block the caller.
+        """
+        return self._enqueue_speech(text, competitor.voice_id, competitor.name,
+                                    competitor.color, cache, optional)
+
+    def queue_announcer(self, text: str, cache: bool = False) -> threading.Event:
+        return self._enqueue_speech(text, ANNOUNCER_VOICE_ID, "ANNOUNCER", "\033[91m", cache, False)
+
+    def _enqueue_speech(self, text, voice_id, name, color, cache, optional) -> threading.Event:
+        done = threading.Event()
+        if optional and self._speech_queue.qsize() > self.SPEECH_BACKLOG:
+            done.set()  # dropped; nothing to wait for
+            return done
+        item = (text, voice_id, name, color, done, cache)
+        if cache:
+            self._spoken_cached.add((voice_id, text))  # _say will store it; don't prewarm
+        if threading.get_ident() == self._loop_thread.ident:
+            self._offer_speech(item)  # already on the loop; never block it
+        elif optional:
+            self._loop.call_soon_threadsafe(self._offer_speech, item)
+        else:
+            # Required lines from other threads wait for room in the queue
+            self._run_on_loop(self._speech_queue.put(item))
+        return done
 
-    def queue_announcer(self, text: str):
-        self._speech_queue.put((text, ANNOUNCER_VOICE_ID, "ANNOUNCER", "\033[91m"))
+    def _offer_speech(self, item):
+        try:
+            self._speech_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            item[4].set()
 
     def update_progress(self, name: str, status: str, events: int = 0):
         with self.progress_lock:
@@ -455,19 +872,27 @@ class BattleArena:
     def _apply_damage(self, name: str, amount: int):
         with self.hp_lock:
             self.hp[name] = max(0, self.hp[name] - amount)
+            self._state_bumped()
         safe_print(f"  💥 {name} takes {amount} damage! HP: {self.hp[name]}")
 
     def _restore_hp(self, name: str, amount: int = 5):
         with self.hp_lock:
             self.hp[name] = min(100, self.hp[name] + amount)
+            self._state_bumped()
 
     def _declare_winner(self) -> str:
         with self.hp_lock:
             winner_name = max(self.hp, key=self.hp.get)
             self.winner = winner_name
+            self._state_bumped()
         return winner_name
 
-    def run_competitor(self, competitor: Competitor):
+    def _state_bumped(self):
+        # Caller holds hp_lock
+        self.state_version += 1
+        self.state_changed.notify_all()
+
+    async def run_competitor(self, competitor: Competitor):
         work_dir = self.arena_dir / competitor.name.lower()
         work_dir.mkdir(exist_ok=True)
 
@@ -478,88 +903,152 @@ Your approach must be: {competitor.approach}
 Work in the current directory. Create any files needed.
 Save the main page as index.html. Be decisive and execute quickly."""
 
-        cmd = ["claude", "--output-format", "stream-json", "--verbose",
-               "--dangerously-skip-permissions", "-p", prompt]
-
-        intro = random.choice(competitor.intro)
-        self.queue_speech(intro, competitor)
-        time.sleep(1.5)
+        cmd = [*CLAUDE_ARGV, prompt]
 
-        process = subprocess.Popen(
-            cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE, text=True, bufsize=1, cwd=str(work_dir)
-        )
+        # One competitor crashing, or failing to start, must not take the
+        # gather (and the other agents) down with it
+        process = None
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd, stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL, cwd=str(work_dir), limit=self.STREAM_LIMIT
+            )
+            await self._follow_competitor(competitor, process)
+        except Exception as e:
+            safe_print(f"{competitor.color}[{competitor.name}] ❌ {e}\033[0m")
+            with self.progress_lock:
+                events = self.progress[competitor.name]["events"]
+            self.update_progress(competitor.name, "failed ✗", events)
+        finally:
+            if process is not None and process.returncode is None:
+                process.kill()
+        return work_dir
 
+    async def _follow_competitor(self, competitor: Competitor, process):
         self.update_progress(competitor.name, "coding", 0)
 
+        rng = competitor.rng
+        trash = self._trash[competitor.name]
+        trash_deck = shuffled_cycle(trash, rng)
+        hype_deck = shuffled_cycle(competitor.think_hype, rng)
         events = 0
-        last_trash = time.time()
-        last_hype = time.time()
+        reported = 0
+        last_report = 0.0
+        finished = False
+        # Monotonic deadlines: immune to wall-clock jumps, and the chance
+        # rolls below only happen once a timer is actually due
+        next_trash = time.monotonic() + self.TRASH_INTERVAL
+        next_hype = time.monotonic() + self.HYPE_INTERVAL
 
         while True:
-            line = process.stdout.readline()
-            if not line and process.poll() is not None:
-                break
-            line_str = line.strip()
-            if not line_str:
-                continue
+            # Wait for output until the next trash or hype deadline, but never
+            # less than a tick, so a failed chance roll retries at most once a tick
+            timeout = max(self.CHATTER_TICK, min(next_trash, next_hype) - time.monotonic())
             try:
-                event = json.loads(line_str)
-            except json.JSONDecodeError:
-                continue
+                line = await asyncio.wait_for(process.stdout.readline(), timeout)
+            except asyncio.TimeoutError:
+                line = None
+            except ValueError:
+                continue  # a line over STREAM_LIMIT; the reader already dropped it
+            if line == b"":  # EOF
+                break
 
+            event = {}
+            if line and line.strip():
+                events += 1
+
+                # Only assistant and result events are acted on below, so the
+                # tool_result/system lines that dominate the stream skip decoding.
+                if b'"assistant"' in line or b'"result"' in line:
+                    try:
+                        event = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        pass
             event_type = event.get("type")
-            events += 1
-            self.update_progress(competitor.name, "coding", events)
 
             if event_type == "assistant":
                 for block in event.get("message", {}).get("content", []):
                     if block.get("type") == "text":
-                        text = block.get("text", "").strip()
-                        if text and len(text) > 30:
-                            safe_print(f"{competitor.color}[{competitor.name}] 💬 {text[:120]}\033[0m")
-                            if random.random() < 0.25:
-                                self.queue_speech(text[:120], competitor)
+                        # Only the first 120 chars are ever shown or spoken, so
+                        # strip and slice a short prefix, not a multi-KB message
+                        head = block.get("text", "")[:200].strip()[:120]
+                        if len(head) > 30:
+                            safe_print(f"{competitor.color}[{competitor.name}] 💬 {head}\033[0m")
+                            if rng.random() < 0.25:
+                                self.queue_speech(head, competitor, optional=True)
                     elif block.get("type") == "tool_use":
                         safe_print(f"{competitor.color}[{competitor.name}] 🔧 {block.get('name')}\033[0m")
 
-            now = time.time()
-            if now - last_trash > 10 and random.random() < 0.4:
-                with self.progress_lock:
-                    opponents = [k for k in self.progress if k != competitor.name]
-                if opponents:
-                    opp = random.choice(opponents)
-                    talk = random.choice(competitor.trash_talk).format(opponent=opp)
-                    self.queue_speech(talk, competitor)
-                    last_trash = now
-
-            if now - last_hype > 15 and random.random() < 0.3:
-                phrase = random.choice(competitor.thinking + competitor.self_hype)
-                self.queue_speech(phrase, competitor)
-                last_hype = now
+            now = time.monotonic()
+            # Hundreds of lines can arrive per second; publish the count in
+            # batches rather than taking both progress locks per line
+            if events != reported and not finished and (line is None or now - last_report >= self.PROGRESS_INTERVAL):
+                self.update_progress(competitor.name, "coding", events)
+                reported, last_report = events, now
+
+            if now >= next_trash and rng.random() < 0.4 and trash:
+                self.queue_speech(next(trash_deck), competitor, cache=True, optional=True)
+                next_trash = now + self.TRASH_INTERVAL
+
+            if now >= next_hype and rng.random() < 0.3:
+                phrase = next(hype_deck)
+                self.queue_speech(phrase, competitor, cache=True, optional=True)
+                next_hype = now + self.HYPE_INTERVAL
 
             if event_type == "result":
                 if event.get("is_error"):
-                    self.queue_speech(random.choice(competitor.frustrated), competitor)
+                    # Never block the event loop on a full queue: the speech
+                    # worker needs the loop to synthesize and drain it.
+                    self.queue_speech(rng.choice(competitor.frustrated), competitor,
+                                      cache=True, optional=True)
                 else:
                     self.update_progress(competitor.name, "finished ✓", events)
+                    finished = True
 
-        process.wait()
-        return work_dir
+        if events != reported and not finished:
+            self.update_progress(competitor.name, "coding", events)
+        await process.wait()
 
-    def _llm_generate(self, prompt: str) -> str:
+    async def _run_competitors(self) -> List[Path]:
+        """Run every competitor as a task on the shared loop."""
+        # Intros are queued in roster order up front; the speech queue plays
+        # them one after another while every subprocess starts at once.
+        for c in self.competitors:
+            intros_done = self.queue_speech(c.rng.choice(c.intro), c, cache=True)
+        self._prewarm = asyncio.create_task(self._prewarm_cache(intros_done))
+        return await asyncio.gather(*(self.run_competitor(c) for c in self.competitors))
+
+    async def _llm_generate(self, prompt: str) -> str:
+        # A subprocess coroutine on the shared loop, so concurrent calls just
+        # multiplex pipe waits instead of each holding a thread. The whole
+        # commentary round is submitted at once, so cap how many run together.
+        if self._llm_slots is None:
+            self._llm_slots = asyncio.Semaphore(self.LLM_CONCURRENCY)
+        async with self._llm_slots:
+            return await self._run_claude(prompt)
+
+    async def _run_claude(self, prompt: str) -> str:
         try:
-            result = subprocess.run(
-                ["claude", "--output-format", "json", "-p", prompt],
-                capture_output=True, text=True, timeout=30
+            process = await asyncio.create_subprocess_exec(
+                *CLAUDE_JSON_ARGV, prompt,
+                stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
             )
-            if result.returncode == 0:
-                return json.loads(result.stdout).get("result", "").strip()
+            try:
+                out, _ = await asyncio.wait_for(process.communicate(), self.LLM_TIMEOUT)
+            except asyncio.TimeoutError:
+                # Don't wait on it: a grandchild still holding the pipe
+                # would keep wait() from returning
+                process.kill()
+                raise TimeoutError(f"claude timed out after {self.LLM_TIMEOUT}s")
+            if process.returncode == 0:
+                # orjson takes the raw bytes, so skip text-mode decoding of stdout
+                return orjson.loads(out).get("result", "").strip()
         except Exception as e:
             safe_print(f"  [llm error] {e}")
         return ""
 
-    def _generate_critique(self, critic: Competitor, creator: Competitor, html: str) -> str:
+    async def _generate_critique(self, critic: Competitor, creator: Competitor, html: str) -> str:
         if critic.name == creator.name:
             return ""
         prompt = f"""You are {critic.name}. Personality: {critic.approach}
@@ -567,34 +1056,55 @@ Save the main page as index.html. Be decisive and execute quickly."""
 Roast {creator.name}'s HTML in ONE sentence under 15 words. Reference their actual code. Stay in character. English only. No quotes or markdown.
 
 Their code:
-{html[:2000]}"""
-        return self._llm_generate(prompt).strip("\"'") or f"{creator.name}'s work is mid."
+{html}"""
+        return (await self._llm_generate(prompt)).strip("\"'") or f"{creator.name}'s work is mid."
 
-    def _generate_defense(self, creator: Competitor, critics: List[Competitor], html: str) -> str:
+    async def _generate_defense(self, creator: Competitor, critics: List[Competitor], html: str) -> str:
         names = " and ".join(c.name for c in critics)
         prompt = f"""You are {creator.name}. Personality: {creator.approach}
 
 {names} roasted you. Defend in ONE sentence under 15 words. Reference your actual code. Stay in character. English only. No quotes or markdown.
 
 Your code:
-{html[:2000]}"""
-        return self._llm_generate(prompt).strip("\"'") or "My approach was clearly superior!"
-
-    def _score_damage(self, critique: str) -> int:
-        prompt = f"""Rate how savage this critique is from 1-10. Respond with a single integer only.
-
-"{critique}" """
+{html}"""
+        return (await self._llm_generate(prompt)).strip("\"'") or "My approach was clearly superior!"
+
+    async def _critiques_and_scores(self, critics: List[Competitor], creator: Competitor, html: str):
+        """Every critic's take on one site, scored together: [(critique, damage), ...]."""
+        critiques = await asyncio.gather(
+            *(self._generate_critique(c, creator, html) for c in critics))
+        return list(zip(critiques, await self._score_damage(critiques)))
+
+    async def _score_damage(self, critiques: List[str]) -> List[int]:
+        # One LLM call rates the whole batch instead of one call per critique
+        numbered = "\n".join(f'{i + 1}. "{c}"' for i, c in enumerate(critiques))
+        prompt = f"""Rate how savage each of these critiques is from 1-10.
+Respond with a JSON array of {len(critiques)} integers only, in order.
+
+{numbered}"""
+        reply = await self._llm_generate(prompt)
         try:
-            score = int(self._llm_generate(prompt).strip())
-            return max(1, min(10, score)) * 3
-        except (ValueError, TypeError):
-            return 9  # default
+            scores = orjson.loads(reply[reply.index("["):reply.rindex("]") + 1])
+            if len(scores) == len(critiques):
+                return [max(1, min(10, int(s))) * 3 for s in scores]
+        except (ValueError, TypeError):  # JSONDecodeError is a ValueError
+            pass
+        return [9] * len(critiques)  # default
 
-    def start_dashboard(self):
-        """Start HTTP dashboard server on port 8000."""
+    def start_dashboard(self, results: dict):
+        """Start the HTTP server on port 8000 for the dashboard and every site.
+
+        Each competitor's work dir is served under /sites/<name>/ from the same
+        server, so there is one listener instead of one per competitor.
+        """
         arena_ref = self
-        comp_data = [{"name": c.name, "emoji": c.emoji, "color": c.color.replace("\033[", "\\033["),
-                      "port": c.port} for c in self.competitors]
+        site_dirs = {wd.name: str(wd) for wd in results.values()
+                     if wd and (wd / "index.html").exists()}
+        # The agents are done writing, so a site file is read the first time
+        # it's requested and kept (up to SITE_CACHE_MAX) for later reloads
+        site_cache = {}
+        site_cache_lock = threading.Lock()
+        site_cache_bytes = 0
 
         # Build proper color mapping for JS (ANSI -> CSS color)
         color_map = {
@@ -602,114 +1112,189 @@ Your code:
             "\033[92m": "#50fa7b", "\033[94m": "#6272a4", "\033[97m": "#f8f8f2",
         }
         js_comps = [{"name": c.name, "emoji": c.emoji,
-                     "color": color_map.get(c.color, "#ffffff"), "port": c.port}
+                     "color": color_map.get(c.color, "#ffffff"), "slug": c.name.lower()}
                     for c in self.competitors]
 
-        dashboard_html = DASHBOARD_HTML_TEMPLATE.format(
+        # The page never changes once built, so it's encoded once, not per request
+        dashboard_bytes = DASHBOARD_HTML_TEMPLATE.format(
             task=self.task,
             competitors_json=json.dumps(js_comps)
-        )
+        ).encode()
 
-        class Handler(http.server.BaseHTTPRequestHandler):
+        class Handler(http.server.SimpleHTTPRequestHandler):
             def do_GET(self):
-                if self.path == "/state":
-                    body = json.dumps(arena_ref.get_dashboard_state()).encode()
+                if self.path.startswith("/sites/"):
+                    if not self._send_site_file():
+                        super().do_GET()  # redirects, 404s and oversized files
+                elif self.path == "/state":
+                    body = orjson.dumps(arena_ref.get_dashboard_state())
                     self.send_response(200)
                     self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.send_header("Cache-Control", "no-store")
                     self.send_header("Access-Control-Allow-Origin", "*")
                     self.end_headers()
                     self.wfile.write(body)
+                elif self.path == "/events":
+                    self._stream_state()
                 else:
-                    body = dashboard_html.encode()
                     self.send_response(200)
-                    self.send_header("Content-Type", "text/html")
+                    self.send_header("Content-Type", "text/html; charset=utf-8")
+                    self.send_header("Content-Length", str(len(dashboard_bytes)))
+                    # Same port, different battle next run: revalidate, don't keep it
+                    self.send_header("Cache-Control", "no-cache")
                     self.end_headers()
-                    self.wfile.write(body)
+                    self.wfile.write(dashboard_bytes)
+
+            def _stream_state(self):
+                # One long-lived response per tab; a frame goes out only when
+                # HP or the winner changes, plus a keepalive so dead tabs are noticed
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                seen = None
+                try:
+                    while True:
+                        with arena_ref.state_changed:
+                            arena_ref.state_changed.wait_for(
+                                lambda: arena_ref.state_version != seen, timeout=15)
+                            changed = arena_ref.state_version != seen
+                            seen = arena_ref.state_version
+                        if changed:
+                            self.wfile.write(b"data: " + orjson.dumps(arena_ref.get_dashboard_state()) + b"\n\n")
+                        else:
+                            self.wfile.write(b": keepalive\n\n")
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+            def _send_site_file(self) -> bool:
+                nonlocal site_cache_bytes
+                slug, sep, rest = urllib.parse.urlsplit(self.path).path[len("/sites/"):].partition("/")
+                if slug not in site_dirs or not sep:
+                    return False
+                rest = urllib.parse.unquote(rest)
+                if not rest or rest.endswith("/"):
+                    rest += "index.html"
+                key = (slug, rest)
+                with site_cache_lock:
+                    entry = site_cache.get(key)
+                if entry is None:
+                    entry = arena_ref._load_site_file(Path(site_dirs[slug]), rest)
+                    if entry is None:
+                        return False
+                    with site_cache_lock:
+                        if key not in site_cache and site_cache_bytes + len(entry[0]) <= arena_ref.SITE_CACHE_MAX:
+                            site_cache[key] = entry
+                            site_cache_bytes += len(entry[0])
+                body, content_type, etag = entry
+                # no-cache + ETag: iframe reloads revalidate and get an empty 304
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return True
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+                self.end_headers()
+                self.wfile.write(body)
+                return True
+
+            def translate_path(self, path):
+                # /sites/<name>/<file> -> <work dir of name>/<file>
+                slug, _, rest = path[len("/sites/"):].partition("/")
+                directory = site_dirs.get(slug)
+                if directory is None:
+                    return ""  # unknown site -> 404
+                self.directory = directory
+                return super().translate_path("/" + rest)
 
             def log_message(self, *args):
                 pass
 
-        def serve():
-            with http.server.ThreadingHTTPServer(("", 8000), Handler) as s:
-                s.serve_forever()
-
-        t = threading.Thread(target=serve, daemon=True)
+        # Bind here rather than in the thread so the port is listening (or the
+        # bind has failed loudly) before the browser is pointed at it.
+        # ThreadingHTTPServer already sets SO_REUSEADDR and daemon request threads.
+        server = http.server.ThreadingHTTPServer(("", 8000), Handler)
+        t = threading.Thread(target=server.serve_forever, daemon=True)
         t.start()
 
-    def start_competitor_servers(self, results: dict):
-        """Start HTTP servers for each competitor's site."""
-        for competitor in self.competitors:
-            work_dir = results.get(competitor.name)
-            if work_dir and (work_dir / "index.html").exists():
-                handler = partial(http.server.SimpleHTTPRequestHandler, directory=str(work_dir))
-
-                def serve(port, h):
-                    with http.server.ThreadingHTTPServer(("", port), h) as s:
-                        s.serve_forever()
-
-                t = threading.Thread(target=serve, args=(competitor.port, handler), daemon=True)
-                t.start()
+    def _load_site_file(self, root: Path, rel: str) -> Optional[tuple]:
+        """(body, content type, ETag) for one file under root, or None to fall back to disk."""
+        path = (root / rel).resolve()
+        if not path.is_relative_to(root.resolve()):
+            return None  # '..' escapes: let SimpleHTTPRequestHandler refuse it
+        try:
+            if not path.is_file() or path.stat().st_size > self.SITE_FILE_MAX:
+                return None
+            body = path.read_bytes()
+        except OSError:
+            return None
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        etag = '"%s"' % hashlib.blake2b(body, digest_size=12).hexdigest()
+        return body, content_type, etag
 
     def commentary_round(self, results: dict):
         safe_print("\n" + "═" * 60)
         safe_print("🎤 COMMENTARY ROUND - Let's Review Each Other's Work!")
         safe_print("═" * 60 + "\n")
-        time.sleep(2)
 
         html_contents = {}
         for c in self.competitors:
             wd = results.get(c.name)
             if wd and (wd / "index.html").exists():
-                html_contents[c.name] = (wd / "index.html").read_text()
-
+                # Prompts only see an excerpt, so read a bounded head rather
+                # than the whole page and cut it to size once, here
+                with open(wd / "index.html", "rb") as f:
+                    head = f.read(self.HTML_HEAD_BYTES).decode("utf-8", errors="ignore")
+                html_contents[c.name] = head[:self.PROMPT_HTML_CHARS]
+
+        # No review depends on another's text, so every LLM call for the whole
+        # round starts now; later sites generate while earlier ones are spoken.
+        reviews = []
         for creator in self.competitors:
             if creator.name not in html_contents:
                 continue
             creator_html = html_contents[creator.name]
-            safe_print(f"\n{creator.color}📺 Reviewing {creator.name}'s work...\033[0m\n")
+            critics = [c for c in self.competitors if c.name != creator.name]
+            target = creator.rng.choice(critics)
+            scored = self._submit(self._critiques_and_scores(critics, creator, creator_html))
+            defense = self._submit(self._generate_defense(creator, critics, creator_html))
+            counter = None
+            if target.name in html_contents:
+                counter = self._submit(
+                    self._critiques_and_scores([creator], target, html_contents[target.name]))
+            reviews.append((creator, critics, target, scored, defense, counter))
 
+        for creator, critics, target, scored, defense, counter in reviews:
+            safe_print(f"\n{creator.color}📺 Reviewing {creator.name}'s work...\033[0m\n")
             self.queue_speech(f"Let's see what {creator.name} built!", creator)
-            time.sleep(2)
 
-            critics = [c for c in self.competitors if c.name != creator.name]
-            critiques = {}
-            damages = {}
-
-            def fetch(critic, creator_c, html, name):
-                c_text = self._generate_critique(critic, creator_c, html)
-                critiques[name] = c_text
-                damages[name] = self._score_damage(c_text)
-
-            threads = [threading.Thread(target=fetch, args=(c, creator, creator_html, c.name))
-                       for c in critics]
-            for t in threads:
-                t.start()
-            for t in threads:
-                t.join()
-
-            for critic in critics:
-                critique = critiques.get(critic.name, "No comment.")
-                dmg = damages.get(critic.name, 9)
+            # Queue every critique at once so the speech queue never runs dry;
+            # damage lands as each one finishes playing.
+            spoken = []
+            for critic, (critique, damage) in zip(critics, scored.result()):
                 safe_print(f"{critic.color}[{critic.name}] 💬 {critique}\033[0m")
-                self.queue_speech(critique, critic)
-                time.sleep(0.5)
-                self._apply_damage(creator.name, dmg)
-                time.sleep(2.5)
+                spoken.append((damage, self.queue_speech(critique, critic)))
+            for damage, done in spoken:
+                done.wait(timeout=self.SPEECH_TIMEOUT)
+                self._apply_damage(creator.name, damage)
 
-            defense = self._generate_defense(creator, critics, creator_html)
+            defense = defense.result()
             safe_print(f"{creator.color}[{creator.name}] 🛡️  {defense}\033[0m")
-            self.queue_speech(defense, creator)
+            done = self.queue_speech(defense, creator)
             self._restore_hp(creator.name, 5)
-            time.sleep(3)
+            done.wait(timeout=self.SPEECH_TIMEOUT)
 
-            target = random.choice(critics)
-            if target.name in html_contents:
-                counter = self._generate_critique(creator, target, html_contents[target.name])
-                dmg = self._score_damage(counter)
+            if counter is not None:
+                (counter, dmg), = counter.result()
                 safe_print(f"{creator.color}[{creator.name}] 💥 {counter}\033[0m")
-                self.queue_speech(counter, creator)
+                self.queue_speech(counter, creator).wait(timeout=self.SPEECH_TIMEOUT)
                 self._apply_damage(target.name, dmg)
-                time.sleep(3)
 
         safe_print("\n" + "═" * 60)
         safe_print("🎬 Commentary complete!")
@@ -726,20 +1311,8 @@ Your code:
 
         self._progress_display.start()
 
-        threads = []
-        results = {}
-
-        def run_and_store(competitor):
-            results[competitor.name] = self.run_competitor(competitor)
-
-        for c in self.competitors:
-            t = threading.Thread(target=run_and_store, args=(c,))
-            threads.append(t)
-            t.start()
-            time.sleep(1)
-
-        for t in threads:
-            t.join()
+        work_dirs = self._run_on_loop(self._run_competitors())
+        results = {c.name: wd for c, wd in zip(self.competitors, work_dirs)}
 
         self._progress_display.stop()
 
@@ -747,19 +1320,18 @@ Your code:
         safe_print("🏁 ALL AGENTS FINISHED CODING!")
         safe_print("═" * 60 + "\n")
 
+        # The speech queue plays these back to back; the dashboard comes up
+        # while they play and commentary waits for the last one to finish.
         for c in self.competitors:
-            self.queue_speech(random.choice(c.victory), c)
-            time.sleep(2.5)
+            victory_done = self.queue_speech(c.rng.choice(c.victory), c, cache=True)
 
-        # Start servers and open dashboard
-        self.start_competitor_servers(results)
-        self.start_dashboard()
-        time.sleep(1)
+        # Start the server and open the dashboard
+        self.start_dashboard(results)
 
         safe_print("\n🌐 Dashboard: http://localhost:8000\n")
         self._open_dashboard()
 
-        time.sleep(4)
+        victory_done.wait(timeout=self.SPEECH_TIMEOUT * len(self.competitors))
 
         # Commentary round with HP damage
         self.commentary_round(results)
@@ -778,9 +1350,9 @@ Your code:
         announcement = (f"LADIES AND GENTLEMEN... after an INCREDIBLE battle... "
                         f"the winner with {self.hp[winner_name]} HP remaining... "
                         f"IT IS... {winner_name.upper()}!! WHAT A PERFORMANCE TONIGHT!")
+        # Queued behind the announcer, so it plays right after without a guessed pause
         self.queue_announcer(announcement)
-        time.sleep(5)
-        self.queue_speech(random.choice(winner_comp.victory), winner_comp)
+        self.queue_speech(winner_comp.rng.choice(winner_comp.victory), winner_comp, cache=True)
 
         # Keep servers running
         safe_print("\n📺 Servers running at http://localhost:8000 - Press Ctrl+C to exit\n")
@@ -790,15 +1362,27 @@ Your code:
         except KeyboardInterrupt:
             safe_print("\n\n👋 Shutting down...")
 
-        self._running = False
+        if self._prewarm is not None:
+            self._loop.call_soon_threadsafe(self._prewarm.cancel)
+        asyncio.run_coroutine_threadsafe(self._speech_queue.put(None), self._loop)
+        try:
+            self._speech_worker.result(timeout=2)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout=1)
+        self._push_audio(None)
         self._audio_thread.join(timeout=1)
-        self._stream.stop_stream()
-        self._stream.close()
-        self._audio.terminate()
+        if self._stream is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._audio.terminate()
 
     def _open_dashboard(self):
         try:
-            subprocess.run(["open", "http://localhost:8000"], check=False)
+            # Fire and forget: nothing here depends on the browser having opened
+            subprocess.Popen(["open", "http://localhost:8000"],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         except Exception:
             pass
 
@@ -823,6 +1407,7 @@ def character_select() -> List[Competitor]:
     safe_print("╚" + "═" * 58 + "╝")
 
     while True:
+        flush_prints()  # the roster has to be on screen before the prompt
         try:
             raw = input("\nSelect 3 fighters by number (e.g. 1 3 5): ").strip()
             picks = list(dict.fromkeys(int(x) for x in raw.split()))  # unique, ordered
@@ -834,8 +1419,6 @@ def character_select() -> List[Competitor]:
             continue
 
         selected = [ALL_COMPETITORS[p - 1] for p in picks]
-        for i, comp in enumerate(selected):
-            comp.port = 8001 + i
 
         safe_print("\n" + "─" * 60)
         safe_print("⚔️  YOUR FIGHTERS:")
@@ -843,6 +1426,7 @@ def character_select() -> List[Competitor]:
             safe_print(f"  {c.color}{c.emoji} {c.name} — {c.tagline}\033[0m")
         safe_print("─" * 60)
 
+        flush_prints()
         confirm = input("\nFight? [Y/n]: ").strip().lower()
         if confirm in ("", "y", "yes"):
             return selected
@@ -857,37 +1441,56 @@ def demo_voices():
         safe_print("Error: CARTESIA_API_KEY not set")
         sys.exit(1)
 
-    audio = pyaudio.PyAudio()
-    stream = audio.open(format=pyaudio.paInt16, channels=1, rate=24000, output=True, frames_per_buffer=1024)
-
-    async def speak(text, voice_id):
-        client = AsyncCartesia(api_key=api_key)
+    async def speak(ws, stream, text, voice_id):
+        # Websocket frames carry raw PCM, so there's no base64 to decode.
+        # The blocking write runs in the executor, one at a time to keep order,
+        # so the next frame is received while the previous one plays.
+        loop = asyncio.get_running_loop()
+        writing = None
         try:
-            async for output in client.tts.sse(
+            async for output in await ws.send(
                 model_id="sonic-2", transcript=text, voice={"mode": "id", "id": voice_id},
-                output_format={"container": "raw", "encoding": "pcm_s16le", "sample_rate": 24000}
+                output_format={"container": "raw", "encoding": "pcm_s16le", "sample_rate": HIGH_QUALITY_SAMPLE_RATE},
+                stream=True,
             ):
-                if hasattr(output, "data") and output.data:
-                    stream.write(base64.b64decode(output.data))
+                if hasattr(output, "audio") and output.audio:
+                    if writing is not None:
+                        await writing
+                    writing = loop.run_in_executor(None, stream.write, output.audio)
         finally:
+            # Never let the caller close the stream under a write in flight
+            if writing is not None:
+                await writing
+
+    async def run_demo():
+        # Reuse one client and websocket for every demo line. Connect before
+        # touching the audio device so an unreachable API fails fast.
+        client = AsyncCartesia(api_key=api_key)
+        ws = audio = None
+        try:
+            ws = await client.tts.websocket()
+            audio, stream = open_pcm_stream(HIGH_QUALITY_SAMPLE_RATE, BattleArena.AUDIO_PERIOD_FRAMES)
+            for c in ALL_COMPETITORS:
+                safe_print(f"{c.color}{c.emoji} [{c.name}]\033[0m")
+                phrase = random.choice(c.intro)
+                safe_print(f"  {phrase}")
+                await speak(ws, stream, phrase, c.voice_id)
+                await asyncio.sleep(0.8)
+
+            safe_print(f"\n\033[91m[ANNOUNCER]\033[0m")
+            announcement = "LADIES AND GENTLEMEN, welcome to BATTLE ROYALE! Let the coding begin!"
+            safe_print(f"  {announcement}")
+            await speak(ws, stream, announcement, ANNOUNCER_VOICE_ID)
+        finally:
+            if audio is not None:
+                stream.stop_stream()
+                stream.close()
+                audio.terminate()
+            if ws is not None:
+                await ws.close()
             await client.close()
 
-    loop = asyncio.new_event_loop()
-    for c in ALL_COMPETITORS:
-        safe_print(f"{c.color}{c.emoji} [{c.name}]\033[0m")
-        phrase = random.choice(c.intro)
-        safe_print(f"  {phrase}")
-        loop.run_until_complete(speak(phrase, c.voice_id))
-        time.sleep(0.8)
-
-    safe_print(f"\n\033[91m[ANNOUNCER]\033[0m")
-    announcement = "LADIES AND GENTLEMEN, welcome to BATTLE ROYALE! Let the coding begin!"
-    safe_print(f"  {announcement}")
-    loop.run_until_complete(speak(announcement, ANNOUNCER_VOICE_ID))
-
-    stream.stop_stream()
-    stream.close()
-    audio.terminate()
+    asyncio.run(run_demo())
     safe_print("\n✅ Voice demo complete!")
 
 
@@ -907,6 +1510,11 @@ def main():
         demo_voices()
         sys.exit(0)
 
+    # Check the key before character select and before any audio or threads spin up
+    if not os.environ.get("CARTESIA_API_KEY"):
+        safe_print("Error: CARTESIA_API_KEY not set")
+        sys.exit(1)
+
     task = " ".join(sys.argv[1:])
 
     # Character select
@@ -3,27 +3,23 @@
 
 import json
 import os
+import shutil
 import subprocess
 import sys
 
+# Resolved once per run rather than on every prompt
+CLAUDE_ARGV = (shutil.which("claude") or "claude", "--output-format", "stream-json", "--verbose", "-p")
+
 
 def test_claude(prompt: str):
     """Run Claude and show all output."""
-    cmd = [
-        "claude",
-        "--output-format", "stream-json",
-        "--verbose",
-        "-p", prompt
-    ]
+    cmd = [*CLAUDE_ARGV, prompt]
 
     print(f"\n[Running] {' '.join(cmd)}")
     print(f"[CWD] {os.getcwd()}")
     print()
 
-    # Get full path to claude
-    import shutil
-    claude_path = shutil.which("claude")
-    print(f"[Claude path] {claude_path}\n")
+    print(f"[Claude path] {CLAUDE_ARGV[0]}\n")
 
     process = subprocess.Popen(
         cmd,
@@ -32,7 +28,7 @@ def test_claude(prompt: str):
         stderr=subprocess.PIPE,
         text=True,
         bufsize=1,
-        env=os.environ.copy()  # Explicitly pass environment
+        env=os.environ  # Explicitly pass environment (no per-call copy)
     )
 
     line_count = 0
@@ -6,23 +6,39 @@ import json
 import os
 import pty
 import re
-import select
+import signal
 import sys
 import termios
+import time
 import tty
 from typing import Optional
 
 from tts_client import TTSClient
 
+_SENTENCE_RE = re.compile(r'[.!?]\s+')
+_FILE_PATH_RE = re.compile(r'^[\w/\\.-]+\.(py|js|ts|json|md)$')
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]')
+# Markdown cleanup, compiled once. Each pass sees the previous one's output
+# (e.g. a '#' inside inline code only goes once the backticks have), so they
+# still run one after another rather than as a single alternation.
+_MARKDOWN_SUBS = (
+    (re.compile(r'\*\*([^*]+)\*\*'), r'\1'),  # Bold
+    (re.compile(r'\*([^*]+)\*'), r'\1'),      # Italic
+    (re.compile(r'`([^`]+)`'), r'\1'),        # Inline code
+    (re.compile(r'#{1,6}\s*'), ''),           # Headers
+    (re.compile(r'^\s*[-*•]\s*', re.MULTILINE), ''),  # Bullet points
+    (re.compile(r'^\s*\d+\.\s*', re.MULTILINE), ''),  # Numbered lists
+)
+
 
 class InteractiveSpeakingClaude:
     """Run Claude Code interactively with real-time TTS narration."""
 
     def __init__(self):
         self.tts: Optional[TTSClient] = None
-        self._running = False
         self._speech_queue: asyncio.Queue = asyncio.Queue()
         self._text_buffer = ""
+        self._scan_offset = 0  # buffer prefix already searched for sentence ends
         self._in_code_block = False
         self._last_spoken = ""
 
@@ -30,7 +46,6 @@ class InteractiveSpeakingClaude:
         """Initialize TTS client."""
         self.tts = TTSClient()
         await self.tts.start()
-        self._running = True
 
         # Announce personality
         intro = self.tts.get_intro()
@@ -38,12 +53,10 @@ class InteractiveSpeakingClaude:
         await self.tts.speak(intro)
 
         # Wait for intro to finish
-        import asyncio
         await asyncio.sleep(2)
 
     async def stop(self):
         """Clean up."""
-        self._running = False
         if self.tts:
             outro = self.tts.get_outro()
             await self.tts.speak(outro)
@@ -62,31 +75,21 @@ class InteractiveSpeakingClaude:
             master_fd, slave_fd = pty.openpty()
 
             # Start Claude process
-            pid = os.fork()
-            if pid == 0:
-                # Child process - run Claude
-                os.close(master_fd)
-                os.setsid()
-                os.dup2(slave_fd, 0)
-                os.dup2(slave_fd, 1)
-                os.dup2(slave_fd, 2)
-                os.close(slave_fd)
-                os.execlp("claude", "claude")
-            else:
-                # Parent process - handle I/O
-                os.close(slave_fd)
+            pid = self._spawn_claude(master_fd, slave_fd)
+            # The child has its own copy of the slave end
+            os.close(slave_fd)
 
-                # Set terminal to raw mode for proper key handling
-                tty.setraw(sys.stdin.fileno())
+            # Set terminal to raw mode for proper key handling
+            tty.setraw(sys.stdin.fileno())
 
-                # Start speech worker
-                speech_task = asyncio.create_task(self._speech_worker())
+            # Start speech worker
+            speech_task = asyncio.create_task(self._speech_worker())
 
-                # Main I/O loop
-                await self._io_loop(master_fd, pid)
+            # Main I/O loop
+            await self._io_loop(master_fd, pid)
 
-                self._running = False
-                await speech_task
+            await self._speech_queue.put(None)  # drain, then stop the worker
+            await speech_task
 
         except Exception as e:
             print(f"\nError: {e}")
@@ -95,49 +98,121 @@ class InteractiveSpeakingClaude:
             termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
             await self.stop()
 
+    @staticmethod
+    def _spawn_claude(master_fd: int, slave_fd: int) -> int:
+        """Start claude in a new session with the pty slave as its stdio."""
+        file_actions = [
+            (os.POSIX_SPAWN_CLOSE, master_fd),
+            (os.POSIX_SPAWN_DUP2, slave_fd, 0),
+            (os.POSIX_SPAWN_DUP2, slave_fd, 1),
+            (os.POSIX_SPAWN_DUP2, slave_fd, 2),
+            (os.POSIX_SPAWN_CLOSE, slave_fd),
+        ]
+        try:
+            # No fork: the parent's page tables are never copied just to exec
+            return os.posix_spawnp("claude", ["claude"], os.environ,
+                                   file_actions=file_actions, setsid=True)
+        except (AttributeError, NotImplementedError):
+            pass  # no posix_spawn, or no setsid support in this libc
+
+        pid = os.fork()
+        if pid == 0:
+            # Child process - run Claude
+            os.close(master_fd)
+            os.setsid()
+            os.dup2(slave_fd, 0)
+            os.dup2(slave_fd, 1)
+            os.dup2(slave_fd, 2)
+            os.close(slave_fd)
+            os.execlp("claude", "claude")
+        return pid
+
     async def _io_loop(self, master_fd: int, pid: int):
         """Handle I/O between user, Claude, and TTS."""
-        loop = asyncio.get_event_loop()
-
-        while True:
-            # Check if Claude is still running
-            result = os.waitpid(pid, os.WNOHANG)
-            if result[0] != 0:
-                break
-
-            # Use select to check for available data
-            rlist, _, _ = select.select([sys.stdin, master_fd], [], [], 0.1)
-
-            for fd in rlist:
-                if fd == sys.stdin:
-                    # User input - forward to Claude
-                    try:
-                        data = os.read(sys.stdin.fileno(), 1024)
-                        if data:
-                            os.write(master_fd, data)
-                    except OSError:
-                        break
-
-                elif fd == master_fd:
-                    # Claude output - display and queue for TTS
-                    try:
-                        data = os.read(master_fd, 4096)
-                        if data:
-                            # Write to terminal
-                            os.write(sys.stdout.fileno(), data)
-
-                            # Process for TTS
-                            text = data.decode("utf-8", errors="ignore")
-                            # Debug: show raw text chunks (uncomment to debug)
-                            # clean = text.replace('\x1b', '<ESC>').replace('\n', '<NL>')
-                            # if len(clean) > 10:
-                            #     print(f"\n[RAW] {clean[:100]}")
-                            await self._process_output(text)
-                    except OSError:
-                        break
-
-            # Small delay to prevent busy-waiting
-            await asyncio.sleep(0.01)
+        # Readers on the event loop instead of a select() poll: the loop (and
+        # the speech worker) never blocks, and output is handled as it arrives
+        loop = asyncio.get_running_loop()
+        stdin_fd = sys.stdin.fileno()
+        output: asyncio.Queue = asyncio.Queue()  # Claude's output; None once it's gone
+        exited = False
+
+        def on_user_input():
+            # User input - forward to Claude
+            try:
+                data = os.read(stdin_fd, 1024)
+                if data:
+                    os.write(master_fd, data)
+                    return
+            except OSError:
+                pass
+            # stdin closed or unreadable: stop forwarding, keep narrating until
+            # Claude itself exits (as the old select loop did)
+            loop.remove_reader(stdin_fd)
+
+        def on_claude_output():
+            try:
+                data = os.read(master_fd, 4096)
+            except OSError:  # EIO once Claude exits and the pty closes
+                data = b""
+            if not data:
+                loop.remove_reader(master_fd)
+                output.put_nowait(None)
+                return
+            # Write to terminal
+            os.write(sys.stdout.fileno(), data)
+            output.put_nowait(data)
+
+        def on_child_exit():
+            nonlocal exited
+            if exited:
+                return
+            try:
+                exited = os.waitpid(pid, os.WNOHANG)[0] != 0
+            except ChildProcessError:  # already reaped
+                exited = True
+            if exited:
+                output.put_nowait(None)
+
+        loop.add_reader(stdin_fd, on_user_input)
+        loop.add_reader(master_fd, on_claude_output)
+        loop.add_signal_handler(signal.SIGCHLD, on_child_exit)
+        on_child_exit()  # in case it exited before the handler was installed
+        try:
+            while True:
+                data = await output.get()
+                if data is None:
+                    break
+                # Process for TTS
+                text = data.decode("utf-8", errors="ignore")
+                # Debug: show raw text chunks (uncomment to debug)
+                # clean = text.replace('\x1b', '<ESC>').replace('\n', '<NL>')
+                # if len(clean) > 10:
+                #     print(f"\n[RAW] {clean[:100]}")
+                await self._process_output(text)
+        finally:
+            loop.remove_reader(stdin_fd)
+            loop.remove_reader(master_fd)
+            loop.remove_signal_handler(signal.SIGCHLD)
+            if not exited:
+                exited = True
+                await self._reap(pid)
+
+    @staticmethod
+    async def _reap(pid: int, grace: float = 2.0):
+        """Stop Claude and reap it without blocking the event loop."""
+        try:
+            if os.waitpid(pid, os.WNOHANG)[0] != 0:
+                return
+            os.kill(pid, signal.SIGTERM)
+            deadline = time.monotonic() + grace
+            while os.waitpid(pid, os.WNOHANG)[0] == 0:
+                if time.monotonic() > deadline:
+                    os.kill(pid, signal.SIGKILL)
+                    os.waitpid(pid, 0)  # SIGKILL can't be ignored; returns promptly
+                    return
+                await asyncio.sleep(0.05)
+        except (ChildProcessError, ProcessLookupError):
+            pass  # already gone
 
     async def _process_output(self, text: str):
         """Process Claude's output and extract speakable content."""
@@ -152,12 +227,14 @@ class InteractiveSpeakingClaude:
                     await self._queue_speech(parts[0])
                 self._in_code_block = True
                 self._text_buffer = parts[1] if len(parts) > 1 else ""
+                self._scan_offset = 0
             else:
                 # Check for end of code block
                 if "```" in self._text_buffer:
                     parts = self._text_buffer.split("```", 1)
                     self._in_code_block = False
                     self._text_buffer = parts[1] if len(parts) > 1 else ""
+                    self._scan_offset = 0
 
         # If not in code block, look for complete sentences
         if not self._in_code_block:
@@ -165,19 +242,18 @@ class InteractiveSpeakingClaude:
 
     async def _extract_sentences(self):
         """Extract complete sentences from buffer and queue for speech."""
-        # Look for sentence endings
-        sentence_pattern = re.compile(r'([.!?])\s+')
-
-        while True:
-            match = sentence_pattern.search(self._text_buffer)
-            if not match:
-                break
-
-            # Extract sentence
-            end_pos = match.end()
-            sentence = self._text_buffer[:end_pos].strip()
-            self._text_buffer = self._text_buffer[end_pos:]
-
+        # One pass from where the last call stopped, then slice the buffer once
+        buffer = self._text_buffer
+        sentences = []
+        start = 0
+        for match in _SENTENCE_RE.finditer(buffer, self._scan_offset):
+            sentences.append(buffer[start:match.end()].strip())
+            start = match.end()
+        self._text_buffer = buffer[start:]
+        # Back up one char: a trailing '.' may get its whitespace next read
+        self._scan_offset = max(0, len(self._text_buffer) - 1)
+
+        for sentence in sentences:
             if sentence:
                 await self._queue_speech(sentence)
 
@@ -198,7 +274,7 @@ class InteractiveSpeakingClaude:
             return
 
         # Skip lines that look like file paths or technical output
-        if re.match(r'^[\w/\\.-]+\.(py|js|ts|json|md)$', text):
+        if _FILE_PATH_RE.match(text):
             return
 
         self._last_spoken = text
@@ -207,19 +283,10 @@ class InteractiveSpeakingClaude:
 
     def _clean_text(self, text: str) -> str:
         """Clean text for speech."""
-        # Remove ANSI escape codes
-        ansi_escape = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]')
-        text = ansi_escape.sub('', text)
-
-        # Remove markdown formatting
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Bold
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)      # Italic
-        text = re.sub(r'`([^`]+)`', r'\1', text)        # Inline code
-        text = re.sub(r'#{1,6}\s*', '', text)           # Headers
-
-        # Remove bullet points
-        text = re.sub(r'^\s*[-*•]\s*', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^\s*\d+\.\s*', '', text, flags=re.MULTILINE)
+        # Remove ANSI escape codes, then markdown formatting and bullets
+        text = _ANSI_RE.sub('', text)
+        for pattern, repl in _MARKDOWN_SUBS:
+            text = pattern.sub(repl, text)
 
         # Clean up whitespace
         text = ' '.join(text.split())
@@ -227,17 +294,14 @@ class InteractiveSpeakingClaude:
         return text.strip()
 
     async def _speech_worker(self):
-        """Process speech queue."""
-        while self._running or not self._speech_queue.empty():
+        """Process speech queue until the None sentinel."""
+        while True:
+            text = await self._speech_queue.get()
+            if text is None:
+                break
             try:
-                text = await asyncio.wait_for(
-                    self._speech_queue.get(),
-                    timeout=0.5
-                )
                 if self.tts and text:
                     await self.tts.speak(text)
-            except asyncio.TimeoutError:
-                continue
             except Exception as e:
                 print(f"\nTTS error: {e}")
 
@@ -2,6 +2,7 @@
 """Speaking Claude Code - AI Coding Streamer with real-time TTS and personalities."""
 
 import asyncio
+import shutil
 import subprocess
 import sys
 from asyncio import Queue
@@ -10,6 +11,8 @@ from typing import Optional
 from stream_parser import StreamParser, ContentType, SpeakableContent
 from tts_client import TTSClient
 
+CLAUDE_ARGV = (shutil.which("claude") or "claude", "--output-format", "stream-json", "--verbose", "-p")
+
 
 class SpeakingClaude:
     """Run Claude Code with real-time TTS narration."""
@@ -17,7 +20,7 @@ class SpeakingClaude:
     def __init__(self):
         self.parser = StreamParser()
         self.tts: Optional[TTSClient] = None
-        self.speech_queue: Queue[SpeakableContent] = Queue()
+        self.speech_queue: Queue[Optional[SpeakableContent]] = Queue()
         self._running = False
 
     async def start(self):
@@ -43,25 +46,18 @@ class SpeakingClaude:
             # Run Claude Code
             await self._run_claude(prompt)
 
-            # Wait for remaining speech to complete
-            await self.speech_queue.join()
-            self._running = False
+            # The worker speaks everything queued ahead of the sentinel, then exits
+            await self.speech_queue.put(None)
             await speech_task
+            self._running = False
 
         finally:
             await self.stop()
 
     async def _run_claude(self, prompt: str):
         """Run Claude Code as a subprocess and parse its output."""
-        cmd = [
-            "claude",
-            "--output-format", "stream-json",
-            "--verbose",
-            "-p", prompt
-        ]
-
         process = await asyncio.create_subprocess_exec(
-            *cmd,
+            *CLAUDE_ARGV, prompt,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE
         )
@@ -120,17 +116,12 @@ class SpeakingClaude:
         ))
 
     async def _speech_worker(self):
-        """Process the speech queue and speak content."""
-        while self._running or not self.speech_queue.empty():
-            try:
-                content = await asyncio.wait_for(
-                    self.speech_queue.get(),
-                    timeout=0.5
-                )
-            except asyncio.TimeoutError:
-                continue
-
+        """Process the speech queue and speak content until the None sentinel."""
+        while True:
+            content = await self.speech_queue.get()
             try:
+                if content is None:
+                    break
                 await self._speak_content(content)
             finally:
                 self.speech_queue.task_done()
@@ -7,6 +7,7 @@ Designed for streaming/entertainment - agents narrate their work with personalit
 import asyncio
 import json
 import random
+import shutil
 import subprocess
 import sys
 import threading
@@ -15,6 +16,9 @@ from typing import Optional
 
 from tts_client import TTSClient
 
+# Looked up once, not on every prompt in the loop
+CLAUDE_ARGV = (shutil.which("claude") or "claude", "--output-format", "stream-json", "--verbose", "-p")
+
 
 class SpeakingClaudeMulti:
     """Run multiple Claude Code prompts with expressive TTS narration."""
@@ -95,12 +99,7 @@ class SpeakingClaudeMulti:
 
     def run_prompt(self, prompt: str):
         """Run a single prompt and speak the response."""
-        cmd = [
-            "claude",
-            "--output-format", "stream-json",
-            "--verbose",
-            "-p", prompt
-        ]
+        cmd = [*CLAUDE_ARGV, prompt]
 
         # Continue session if we have one
         if self._session_id:
@@ -8,6 +8,12 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Iterator, Optional
 
+# Compiled once at import rather than on every chunk of assistant text
+_SENTENCE_END_RE = re.compile(r'[.!?]\s+')
+_CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+_FILE_PATH_RE = re.compile(r'^[\w/\\.]+\.(py|js|ts|json|md|txt|yaml|yml)$')
+_SPEAKABLE_CHAR_RE = re.compile(r'[a-zA-Z0-9\s]')
+
 
 class ContentType(Enum):
     NARRATION = "narration"  # Assistant explanations
@@ -148,19 +154,16 @@ class StreamParser:
 
     def _flush_complete_sentences(self) -> Iterator[SpeakableContent]:
         """Extract and yield complete sentences from buffer."""
-        # Look for sentence endings
-        sentence_endings = re.compile(r'([.!?])\s+')
-
-        while True:
-            match = sentence_endings.search(self._text_buffer)
-            if not match:
-                break
-
-            # Extract the complete sentence
-            end_pos = match.end()
-            sentence = self._text_buffer[:end_pos].strip()
-            self._text_buffer = self._text_buffer[end_pos:]
-
+        # One pass over the buffer, which is sliced once afterwards
+        buffer = self._text_buffer
+        sentences = []
+        start = 0
+        for match in _SENTENCE_END_RE.finditer(buffer):
+            sentences.append(buffer[start:match.end()].strip())
+            start = match.end()
+        self._text_buffer = buffer[start:]
+
+        for sentence in sentences:
             speakable = self._extract_speakable_text(sentence)
             if speakable:
                 yield SpeakableContent(
@@ -180,7 +183,7 @@ class StreamParser:
             return None
         if "```" in text:
             # Remove code blocks from mixed content
-            text = re.sub(r'```[\s\S]*?```', '', text)
+            text = _CODE_BLOCK_RE.sub('', text)
 
         # Skip JSON-like content
         if text.startswith("{") or text.startswith("["):
@@ -191,11 +194,12 @@ class StreamParser:
             return None
 
         # Skip lines that look like file paths or code
-        if re.match(r'^[\w/\\.]+\.(py|js|ts|json|md|txt|yaml|yml)$', text):
+        if _FILE_PATH_RE.match(text):
             return None
 
         # Skip lines that are mostly special characters
-        alphanum_ratio = len(re.findall(r'[a-zA-Z0-9\s]', text)) / len(text)
+        # subn counts the matches without building a list of them
+        alphanum_ratio = _SPEAKABLE_CHAR_RE.subn('', text)[1] / len(text)
         if alphanum_ratio < 0.5:
             return None
 
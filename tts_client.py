@@ -1,12 +1,12 @@
 """Cartesia TTS client with streaming audio playback and personalities."""
 
 import asyncio
-import base64
 import os
 import random
 import threading
+from binascii import a2b_base64
 from dataclasses import dataclass
-from queue import Queue, Empty
+from queue import Queue
 from typing import Optional, List
 
 from cartesia import AsyncCartesia
@@ -297,6 +297,7 @@ class TTSClient:
         self._running = False
 
         if self._playback_thread:
+            self._audio_queue.put(None)  # wake the playback thread so it can exit
             self._playback_thread.join(timeout=1.0)
 
         if self._stream:
@@ -334,9 +335,10 @@ class TTSClient:
                 },
                 speed=speed if speed != "normal" else None
             ):
-                # Audio data comes as base64 in output.data
+                # Audio data comes as base64 in output.data; a2b_base64 skips
+                # the argument checks b64decode does on every small chunk
                 if hasattr(output, "data") and output.data:
-                    audio_bytes = base64.b64decode(output.data)
+                    audio_bytes = a2b_base64(output.data)
                     self._audio_queue.put(audio_bytes)
 
         except Exception as e:
@@ -344,13 +346,14 @@ class TTSClient:
 
     def _playback_loop(self):
         """Background thread for audio playback."""
-        while self._running:
+        while True:
+            # Block until there is audio rather than polling; None means stop
+            audio_chunk = self._audio_queue.get()
+            if audio_chunk is None or not self._running:
+                break
             try:
-                audio_chunk = self._audio_queue.get(timeout=0.1)
-                if audio_chunk and self._stream:
+                if self._stream:
                     self._stream.write(audio_chunk)
-            except Empty:
-                continue
             except Exception as e:
                 print(f"Playback error: {e}")
 